@@ -36,7 +36,7 @@ from pooltool.events import (
     spinning_stationary_transition,
     stick_ball_collision,
 )
-from pooltool.evolution import continuize, simulate
+from pooltool.evolution import continuize, simulate, warm_up
 from pooltool.game.datatypes import GameType
 from pooltool.game.layouts import (
     get_eight_ball_rack,
@@ -75,6 +75,9 @@ from pooltool.system import MultiSystem, System, SystemController, multisystem,
 run = terminal.Run()
 progress = terminal.Progress()
 
+# Load the jitted physics functions now rather than during the first simulation
+warm_up()
+
 
 __all__ = [
     "get_eight_ball_rack",
@@ -138,6 +141,7 @@ __all__ = [
     "image_stack",
     "ShotViewer",
     "simulate",
+    "warm_up",
     "continuize",
     "get_rack",
     "get_ruleset",
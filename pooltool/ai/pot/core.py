@@ -196,6 +196,24 @@ def calc_cut_angle(
     return angle_between_vectors(aim_vector, pocket_vector)
 
 
+def calc_cut_angles(
+    cueball: Coordinate, ghost_ball: Coordinate, potting_points: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """Vectorized calc_cut_angle for a Mx2 array of potting points
+
+    Returns:
+        A length-M array of cut angles, in degrees between [-180, 180].
+    """
+    aim_vector = ghost_ball[:2] - cueball[:2]
+    pocket_vectors = potting_points - ghost_ball[:2]
+
+    # The 2D cross and dot products of the aim vector with each pocket vector
+    cross = aim_vector[0] * pocket_vectors[:, 1] - aim_vector[1] * pocket_vectors[:, 0]
+    dot = pocket_vectors @ aim_vector
+
+    return np.degrees(np.arctan2(cross, dot))
+
+
 def ball_ids_occluding_ballpath(
     ball: Ball, aim_spot: Coordinate, balls: Iterable[Ball]
 ) -> Set[str]:
@@ -413,22 +431,23 @@ def viable_pockets(
     See also: open_pockets
     """
 
+    pockets = list(table.pockets.values())
+    potting_points = np.array(
+        [get_potting_point(ball, table, pocket) for pocket in pockets]
+    ).reshape(-1, 2)
+    cut_angles = np.abs(calc_cut_angles(cue.xyz[:2], ball.xyz[:2], potting_points))
+
     viable = []
-    for pocket in table.pockets.values():
-        cut_angle = np.abs(
-            calc_cut_angle(
-                cue.xyz[:2],
-                ball.xyz[:2],
-                get_potting_point(ball, table, pocket),
-            )
-        )
+    for pocket, cut_angle in zip(pockets, cut_angles):
+        # The cut angle is the cheapest criterion, so it's checked first
+        if cut_angle > max_cut:
+            continue
 
         if (
             not is_pocket_occluded(ball, table, pocket, balls)
             and is_room_for_cue_ball(ball, table, pocket, balls)
             and not is_jaw_in_way(ball, table, pocket)
             and not is_object_ball_occluded(cue, ball, table, pocket, balls)
-            and cut_angle <= max_cut
         ):
             viable.append(
                 (pocket.id, required_precision(cue.state, ball.state, table, pocket))
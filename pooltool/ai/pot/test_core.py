@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+from pooltool.ai.pot.core import calc_cut_angle, calc_cut_angles
+
+
+def test_calc_cut_angles():
+    rng = np.random.default_rng(42)
+
+    for _ in range(200):
+        cueball = rng.uniform(0, 2, size=2)
+        ghost_ball = rng.uniform(0, 2, size=2)
+        potting_points = rng.uniform(-0.1, 2.1, size=(10, 2))
+
+        cut_angles = calc_cut_angles(cueball, ghost_ball, potting_points)
+        assert cut_angles.shape == (len(potting_points),)
+
+        for potting_point, cut_angle in zip(potting_points, cut_angles):
+            expected = calc_cut_angle(cueball, ghost_ball, potting_point)
+            assert cut_angle == pytest.approx(expected, abs=1e-9)
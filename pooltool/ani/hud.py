@@ -101,19 +101,14 @@ class HUD:
             return
 
         for msg in Global.game.log.msgs:
-            if msg["broadcast"]:
+            if msg.broadcast:
                 continue
-            if not msg["quiet"]:
-                timestamp, msg_txt, sentiment = (
-                    msg["elapsed"],
-                    msg["msg"],
-                    msg["sentiment"],
-                )
+            if not msg.quiet:
                 self.elements["log_win"].broadcast_msg(
-                    f"({timestamp}) {msg_txt}",
-                    color=self.elements["log_win"].colors[sentiment],
+                    f"({Global.game.log.elapsed(msg)}) {msg.msg}",
+                    color=self.elements["log_win"].colors[msg.sentiment],
                 )
-                msg["broadcast"] = True
+                msg.broadcast = True
 
         Global.game.log.update = False
 
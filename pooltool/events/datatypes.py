@@ -79,7 +79,7 @@ _class_to_type: Dict[Type[Object], AgentType] = {
 _type_to_class = {v: k for k, v in _class_to_type.items()}
 
 
-@define
+@define(weakref_slot=False)
 class Agent:
     id: str
     agent_type: AgentType
@@ -179,7 +179,7 @@ conversion.register_structure_hook(
 )
 
 
-@define
+@define(weakref_slot=False)
 class Event:
     event_type: EventType
     agents: Tuple[Agent, ...]
@@ -1,4 +1,5 @@
 from pooltool.evolution.continuize import continuize
 from pooltool.evolution.event_based.simulate import simulate as simulate_event_based
+from pooltool.evolution.event_based.simulate import warm_up
 
 simulate = simulate_event_based
@@ -1,9 +1,38 @@
+from typing import Dict, List, Optional, Tuple
+
+import pooltool.constants as const
 import pooltool.physics.evolve as evolve
-from pooltool.events import filter_ball
+from pooltool.events import Agent, AgentType, Event, EventType
 from pooltool.objects.ball.datatypes import BallHistory, BallState
 from pooltool.system.datatypes import System
 
 
+def _events_by_ball(
+    system: System,
+) -> Dict[str, List[Tuple[Event, Optional[Agent]]]]:
+    """Bucket the events of a system by ball in a single pass
+
+    Each ball gets the chronological list of events it is involved in, paired with its
+    agent in that event. Null events (e.g. those marking the start and end times) are
+    added to every ball with an agent of None.
+    """
+    buckets: Dict[str, List[Tuple[Event, Optional[Agent]]]] = {
+        ball_id: [] for ball_id in system.balls
+    }
+
+    for event in system.events:
+        if event.event_type == EventType.NONE:
+            for bucket in buckets.values():
+                bucket.append((event, None))
+            continue
+
+        for agent in event.agents:
+            if agent.agent_type == AgentType.BALL and agent.id in buckets:
+                buckets[agent.id].append((event, agent))
+
+    return buckets
+
+
 def continuize(system: System, dt: float = 0.01, inplace: bool = False) -> System:
     """Create BallHistory for each ball with many timepoints
 
@@ -68,16 +97,26 @@ def continuize(system: System, dt: float = 0.01, inplace: bool = False) -> Syste
     # This is the exact number of timepoints that the ball histories will contain
     num_timestamps = int(system.events[-1].time // dt) + 1
 
+    # Get all events that each ball is involved in, even the null_event events that
+    # mark the start and end times
+    events_by_ball = _events_by_ball(system)
+
     for ball in system.balls.values():
         # Create a new history and add the zeroth event
         history = BallHistory()
         history.add(ball.history[0])
 
         rvw, s = ball.history[0].rvw, ball.history[0].s
+        R, m, u_s, u_sp, u_r, g = (
+            ball.params.R,
+            ball.params.m,
+            ball.params.u_s,
+            ball.params.u_sp,
+            ball.params.u_r,
+            ball.params.g,
+        )
 
-        # Get all events that the ball is involved in, even the null_event events
-        # that mark the start and end times
-        events = filter_ball(system.events, ball.id, keep_nonevent=True)
+        events = events_by_ball[ball.id]
 
         # Tracks which event is currently being handled
         count = 0
@@ -89,10 +128,10 @@ def continuize(system: System, dt: float = 0.01, inplace: bool = False) -> Syste
             if n == (num_timestamps - 1):
                 # We made it to the end. the difference between the final time and
                 # the elapsed time should be < dt
-                assert events[-1].time - elapsed < dt
+                assert events[-1][0].time - elapsed < dt
                 break
 
-            if events[count + 1].time - elapsed > dt:
+            if events[count + 1][0].time - elapsed > dt:
                 # This is the easy case. There is no upcoming event so we simply
                 # evolve the state an amount dt
                 evolve_time = dt
@@ -107,39 +146,39 @@ def continuize(system: System, dt: float = 0.01, inplace: bool = False) -> Syste
                 while True:
                     count += 1
 
-                    if events[count + 1].time - elapsed > dt:
+                    if events[count + 1][0].time - elapsed > dt:
                         # OK, we found the last event between the current timestamp
                         # and the next timestamp. It is events[count].
                         break
 
                 # We need to get the ball's outgoing state from the event. We'll
                 # evolve the system from this state.
-                for agent in events[count].agents:
-                    if agent.matches(ball):
-                        state = agent.final.state.copy()  # type: ignore
-                        break
-                else:
+                event, agent = events[count]
+                if agent is None:
                     raise ValueError("No agents in event match ball")
 
+                state = agent.final.state.copy()  # type: ignore
                 rvw, s = state.rvw, state.s
 
                 # Since this event occurs between two timestamps, we won't be
                 # evolving a full dt. Instead, we evolve this much:
-                evolve_time = elapsed + dt - events[count].time
+                evolve_time = elapsed + dt - event.time
 
             # Whether it was the hard path or the easy path, the ball state is
-            # properly defined and we know how much we need to simulate.
-            rvw, s = evolve.evolve_ball_motion(
-                state=s,
-                rvw=rvw,
-                R=ball.params.R,
-                m=ball.params.m,
-                u_s=ball.params.u_s,
-                u_sp=ball.params.u_sp,
-                u_r=ball.params.u_r,
-                g=ball.params.g,
-                t=evolve_time,
-            )
+            # properly defined and we know how much we need to simulate. Stationary
+            # and pocketed balls don't move, so there is nothing to evolve.
+            if s != const.stationary and s != const.pocketed:
+                rvw, s = evolve.evolve_ball_motion(
+                    state=s,
+                    rvw=rvw,
+                    R=R,
+                    m=m,
+                    u_s=u_s,
+                    u_sp=u_sp,
+                    u_r=u_r,
+                    g=g,
+                    t=evolve_time,
+                )
 
             history.add(BallState(rvw, s, elapsed + dt))
             elapsed += dt
@@ -1,4 +1,5 @@
 from pooltool.events.datatypes import EventType
+from pooltool.utils.strenum import StrEnum, auto
 
 INCLUDED_EVENTS = {
     EventType.NONE,
@@ -12,3 +13,14 @@ INCLUDED_EVENTS = {
     EventType.ROLLING_SPINNING,
     EventType.SLIDING_ROLLING,
 }
+
+
+class BroadphaseType(StrEnum):
+    """The broadphase used to prune ball pairs before solving for collision times
+
+    GRID bins nontranslating balls into a uniform grid. SWEEP_AND_PRUNE keeps them
+    sorted along the long axis of the table.
+    """
+
+    GRID = auto()
+    SWEEP_AND_PRUNE = auto()
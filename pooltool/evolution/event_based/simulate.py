@@ -2,11 +2,30 @@
 
 from __future__ import annotations
 
+import bisect
+import heapq
+from abc import ABC, abstractmethod
 from itertools import combinations
-from typing import Dict, Optional, Set
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import attrs
 import numpy as np
+from numpy.typing import NDArray
 
 import pooltool.constants as const
 import pooltool.physics.evolve as evolve
@@ -29,8 +48,9 @@ from pooltool.events import (
 )
 from pooltool.evolution.continuize import continuize
 from pooltool.evolution.event_based import solve
-from pooltool.evolution.event_based.config import INCLUDED_EVENTS
+from pooltool.evolution.event_based.config import INCLUDED_EVENTS, BroadphaseType
 from pooltool.objects.ball.datatypes import Ball, BallState
+from pooltool.objects.table.datatypes import Table
 from pooltool.objects.table.components import (
     CircularCushionSegment,
     LinearCushionSegment,
@@ -42,6 +62,14 @@ from pooltool.system.datatypes import System
 
 DEFAULT_ENGINE = PhysicsEngine()
 
+# Placeholder agents for events that never happen (time=np.inf). Events only store the
+# IDs and types of their agents, so these are safely shared rather than created anew
+# each time no collision is detected.
+_DUMMY_BALL = Ball.dummy()
+_DUMMY_LINEAR_CUSHION = LinearCushionSegment.dummy()
+_DUMMY_CIRCULAR_CUSHION = CircularCushionSegment.dummy()
+_DUMMY_POCKET = Pocket.dummy()
+
 
 def simulate(
     shot: System,
@@ -53,6 +81,7 @@ def simulate(
     quartic_solver: QuarticSolver = QuarticSolver.HYBRID,
     include: Set[EventType] = INCLUDED_EVENTS,
     max_events: int = 0,
+    broadphase: BroadphaseType = BroadphaseType.GRID,
 ) -> System:
     """Run a simulation on a system and return it
 
@@ -88,6 +117,10 @@ def simulate(
         max_events:
             If this is greater than 0, and the shot has more than this many events, the
             simulation is stopped and the balls are set to stationary.
+        broadphase:
+            Which BroadphaseType do you want to use for pruning ball pairs before
+            solving for ball-ball collision times? The choice doesn't affect the
+            simulation result.
 
     Examples:
         Standard usage:
@@ -149,24 +182,43 @@ def simulate(
         engine.resolver.resolve(shot, event)
         shot.update_history(event)
 
+    table = TableArrays.create(shot.table)
     transition_cache = TransitionCache.create(shot)
+    linear_cushion_cache = LinearCushionCache.create(shot, quartic_solver, table)
+    circular_cushion_cache = CircularCushionCache.create(shot, quartic_solver, table)
+    pocket_cache = PocketCache.create(shot, quartic_solver, table)
+    ball_ball_cache = BallBallCache()
+    pruner = _BROADPHASES[broadphase].create(shot)
+    params = _stack_params(shot)
 
     events = 0
     while True:
         event = get_next_event(
-            shot, transition_cache=transition_cache, quartic_solver=quartic_solver,
+            shot,
+            transition_cache=transition_cache,
+            linear_cushion_cache=linear_cushion_cache,
+            circular_cushion_cache=circular_cushion_cache,
+            pocket_cache=pocket_cache,
+            ball_ball_cache=ball_ball_cache,
+            broadphase=pruner,
+            quartic_solver=quartic_solver,
         )
 
         if event.time == np.inf:
             shot.update_history(null_event(time=shot.t))
             break
 
-        _evolve(shot, event.time - shot.t)
+        _evolve(shot, event.time - shot.t, params)
 
         if event.event_type in include:
             engine.resolver.resolve(shot, event)
             transition_cache.update(event)
+            pruner.update(event)
 
+        linear_cushion_cache.update(shot, event)
+        circular_cushion_cache.update(shot, event)
+        pocket_cache.update(shot, event)
+        ball_ball_cache.update(event)
         shot.update_history(event)
 
         if t_final is not None and shot.t >= t_final:
@@ -185,78 +237,209 @@ def simulate(
     return shot
 
 
-def _evolve(shot: System, dt: float):
+def warm_up() -> None:
+    """Load the just-in-time compiled functions used during simulation
+
+    Numba loads cached machine code (or compiles it, if there is no cache) the first
+    time each function is called. Simulating a small shot pays this cost upfront,
+    rather than during the first real simulation.
+    """
+    simulate(System.example())
+
+
+def _evolve(shot: System, dt: float, params: Optional[NDArray[np.float64]] = None):
     """Evolves current ball an amount of time dt
 
-    FIXME This is very inefficent. each ball should store its natural trajectory
-    thereby avoid a call to the clunky evolve_ball_motion. It could even be a
-    partial function so parameters don't continuously need to be passed
+    All balls are evolved with a single call to `evolve.evolve_ball_motion_batched`.
+
+    Args:
+        params:
+            The output of `_stack_params(shot)`. Since ball parameters don't change
+            during a simulation, pass this to avoid rebuilding it every call.
     """
+    if not shot.balls:
+        return
+
+    if params is None:
+        params = _stack_params(shot)
+
+    balls = shot.balls.values()
+    states = np.fromiter((ball.state.s for ball in balls), dtype=np.int64)
+    rvws, _ = evolve.evolve_ball_motion_batched(
+        states,
+        np.stack([ball.state.rvw for ball in balls]),
+        params,
+        dt,
+    )
 
-    for ball_id, ball in shot.balls.items():
-        rvw, _ = evolve.evolve_ball_motion(
-            state=ball.state.s,
-            rvw=ball.state.rvw,
-            R=ball.params.R,
-            m=ball.params.m,
-            u_s=ball.params.u_s,
-            u_sp=ball.params.u_sp,
-            u_r=ball.params.u_r,
-            g=ball.params.g,
-            t=dt,
-        )
-        ball.state = BallState(rvw, ball.state.s, shot.t + dt)
+    t = shot.t + dt
+    for ball, s, rvw in zip(balls, states, rvws):
+        if s == const.stationary or s == const.pocketed:
+            # Motion is unchanged, so the rvw array can be shared with the old state
+            ball.state = BallState(ball.state.rvw, s, t)
+        else:
+            ball.state = BallState(rvw, s, t)
+
+
+def _stack_params(shot: System) -> NDArray[np.float64]:
+    """Stack the ball parameters required by `evolve.evolve_ball_motion_batched`"""
+    return np.array(
+        [
+            [
+                ball.params.R,
+                ball.params.m,
+                ball.params.u_s,
+                ball.params.u_sp,
+                ball.params.u_r,
+                ball.params.g,
+            ]
+            for ball in shot.balls.values()
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 6)
 
 
 def get_next_event(
     shot: System,
     *,
     transition_cache: Optional[TransitionCache] = None,
+    linear_cushion_cache: Optional[LinearCushionCache] = None,
+    circular_cushion_cache: Optional[CircularCushionCache] = None,
+    pocket_cache: Optional[PocketCache] = None,
+    ball_ball_cache: Optional[BallBallCache] = None,
+    broadphase: Optional[Broadphase] = None,
     quartic_solver: QuarticSolver = QuarticSolver.HYBRID,
 ) -> Event:
-    # Start by assuming next event doesn't happen
-    event = null_event(time=np.inf)
-
     if transition_cache is None:
         transition_cache = TransitionCache.create(shot)
 
+    if broadphase is None:
+        broadphase = CellGrid.create(shot)
+
     transition_event = transition_cache.get_next()
-    if transition_event.time < event.time:
-        event = transition_event
 
-    ball_ball_event = get_next_ball_ball_collision(shot, solver=quartic_solver)
-    if ball_ball_event.time < event.time:
-        event = ball_ball_event
+    # Any ball-ball collision happening after the next transition is irrelevant, which
+    # bounds how far each ball can travel before the next event
+    ball_ball_event = _next_ball_ball_collision(
+        shot,
+        solver=quartic_solver,
+        broadphase=broadphase,
+        horizon=transition_event.time - shot.t,
+        cache=ball_ball_cache,
+    )
 
-    ball_linear_cushion_event = get_next_ball_linear_cushion_collision(shot)
-    if ball_linear_cushion_event.time < event.time:
-        event = ball_linear_cushion_event
+    ball_linear_cushion_event = get_next_ball_linear_cushion_collision(
+        shot, cache=linear_cushion_cache
+    )
 
-    ball_circular_cushion_event = get_next_ball_circular_cushion_event(
-        shot, solver=quartic_solver
+    ball_circular_cushion_event: Union[Event, _Candidate]
+    if circular_cushion_cache is not None:
+        ball_circular_cushion_event = circular_cushion_cache.get_next()
+    else:
+        ball_circular_cushion_event = _next_ball_circular_cushion_collision(
+            shot, solver=quartic_solver
+        )
+
+    ball_pocket_event: Union[Event, _Candidate]
+    if pocket_cache is not None:
+        ball_pocket_event = pocket_cache.get_next()
+    else:
+        ball_pocket_event = _next_ball_pocket_collision(shot, solver=quartic_solver)
+
+    # min() returns the first of equally early events, so ties go to the event type
+    # listed first. If nothing happens, the next event is a null event.
+    event = min(
+        (
+            _NO_EVENT,
+            transition_event,
+            ball_ball_event,
+            ball_linear_cushion_event,
+            ball_circular_cushion_event,
+            ball_pocket_event,
+        ),
+        key=_event_time,
     )
-    if ball_circular_cushion_event.time < event.time:
-        event = ball_circular_cushion_event
 
-    ball_pocket_event = get_next_ball_pocket_collision(shot, solver=quartic_solver)
-    if ball_pocket_event.time < event.time:
-        event = ball_pocket_event
+    if isinstance(event, _Candidate):
+        return event.build()
 
     return event
 
 
+class _Candidate(NamedTuple):
+    """A detected event whose Event object hasn't been built
+
+    Most detected events lose out to an earlier event. Building the Event (and its
+    Agents) is deferred until an event is known to be the next event.
+    """
+
+    time: float
+    factory: Callable[..., Event]
+    objects: Tuple[Any, ...]
+
+    def build(self) -> Event:
+        return self.factory(*self.objects, time=self.time)
+
+
+# The next event when nothing is detected
+_NO_EVENT = _Candidate(np.inf, null_event, ())
+
+_event_time = attrgetter("time")
+
+
+@attrs.define
+class EventHeap:
+    """A min-heap of events, one event per key
+
+    Replacing the event of a key doesn't remove the outdated heap entry. Instead,
+    outdated entries are lazily discarded when they reach the top of the heap. Events
+    with equal times are ordered by when their key was first pushed.
+    """
+
+    events: Dict[str, Event] = attrs.field(factory=dict)
+    heap: List[Tuple[float, int, str]] = attrs.field(factory=list)
+    order: Dict[str, int] = attrs.field(factory=dict)
+
+    def push(self, key: str, event: Event) -> None:
+        if key not in self.order:
+            self.order[key] = len(self.order)
+
+        self.events[key] = event
+        heapq.heappush(self.heap, (event.time, self.order[key], key))
+
+    def peek(self) -> Event:
+        """Returns the event with the smallest time"""
+        while self.heap:
+            time, _, key = self.heap[0]
+            if self.events[key].time == time:
+                return self.events[key]
+
+            heapq.heappop(self.heap)
+
+        return null_event(time=np.inf)
+
+    @classmethod
+    def from_dict(cls, events: Dict[str, Event]) -> EventHeap:
+        heap = cls()
+        for key, event in events.items():
+            heap.push(key, event)
+        return heap
+
+
 @attrs.define
 class TransitionCache:
     transitions: Dict[str, Event] = attrs.field()
+    heap: EventHeap = attrs.field(init=False)
 
     @transitions.default
     def _null(self):
         return {"null": null_event(time=np.inf)}
 
+    def __attrs_post_init__(self):
+        self.heap = EventHeap.from_dict(self.transitions)
+
     def get_next(self) -> Event:
-        return min(
-            (trans for trans in self.transitions.values()), key=lambda event: event.time
-        )
+        return self.heap.peek()
 
     def update(self, event: Event) -> None:
         """Update transition cache for all balls in Event"""
@@ -264,6 +447,7 @@ class TransitionCache:
             if agent.agent_type == AgentType.BALL:
                 assert isinstance(ball := agent.final, Ball)
                 self.transitions[agent.id] = _next_transition(ball)
+                self.heap.push(agent.id, self.transitions[agent.id])
 
     @classmethod
     def create(cls, shot: System) -> TransitionCache:
@@ -272,6 +456,389 @@ class TransitionCache:
         )
 
 
+@attrs.define(frozen=True)
+class TableArrays:
+    """Table object parameters stacked into contiguous arrays
+
+    Table objects don't change during a shot, so their parameters are gathered once
+    rather than for every collision check.
+
+    Attributes:
+        lines:
+            A Mx3 array of linear cushion segment line coefficients. Each row is (lx,
+            ly, l0) of the corresponding segment in `linear`.
+        circles:
+            A Mx3 array of circular cushion segment circles. Each row is (a, b, radius)
+            of the corresponding segment in `circular`.
+        pocket_circles:
+            A Mx3 array of pocket circles. Each row is (a, b, radius) of the
+            corresponding pocket in `pockets`.
+    """
+
+    linear: Tuple[LinearCushionSegment, ...]
+    lines: NDArray[np.float64]
+    p1: NDArray[np.float64]
+    p2: NDArray[np.float64]
+    direction: NDArray[np.int64]
+    circular: Tuple[CircularCushionSegment, ...]
+    circles: NDArray[np.float64]
+    pockets: Tuple[Pocket, ...]
+    pocket_circles: NDArray[np.float64]
+
+    @classmethod
+    def create(cls, table: Table) -> TableArrays:
+        linear = tuple(table.cushion_segments.linear.values())
+        circular = tuple(table.cushion_segments.circular.values())
+        pockets = tuple(table.pockets.values())
+
+        return cls(
+            linear=linear,
+            lines=np.array(
+                [[cushion.lx, cushion.ly, cushion.l0] for cushion in linear],
+                dtype=np.float64,
+            ).reshape(-1, 3),
+            p1=np.array([cushion.p1 for cushion in linear], dtype=np.float64).reshape(
+                -1, 3
+            ),
+            p2=np.array([cushion.p2 for cushion in linear], dtype=np.float64).reshape(
+                -1, 3
+            ),
+            direction=np.array(
+                [cushion.direction for cushion in linear], dtype=np.int64
+            ),
+            circular=circular,
+            circles=np.array(
+                [[cushion.a, cushion.b, cushion.radius] for cushion in circular],
+                dtype=np.float64,
+            ).reshape(-1, 3),
+            pockets=pockets,
+            pocket_circles=np.array(
+                [[pocket.a, pocket.b, pocket.radius] for pocket in pockets],
+                dtype=np.float64,
+            ).reshape(-1, 3),
+        )
+
+
+@attrs.define
+class BallCollisionCache(ABC):
+    """Caches the next collision of each ball with one type of table object
+
+    A ball's trajectory only changes when it is involved in an event, so its next
+    collision only needs to be recalculated then. Subclasses define `detect`.
+    """
+
+    collisions: Dict[str, Event]
+    table: TableArrays
+    solver: QuarticSolver = attrs.field(default=QuarticSolver.HYBRID)
+    heap: EventHeap = attrs.field(init=False)
+
+    def __attrs_post_init__(self):
+        self.heap = EventHeap.from_dict(self.collisions)
+
+    def get_next(self) -> Event:
+        return self.heap.peek()
+
+    def update(self, shot: System, event: Event) -> None:
+        """Update cache for all balls in Event
+
+        Unlike TransitionCache.update, this should be called for every event, not just
+        resolved events. Otherwise an unresolved collision would be detected over and
+        over again.
+        """
+        for agent in event.agents:
+            if agent.agent_type == AgentType.BALL:
+                ball = shot.balls[agent.id]
+                self.collisions[agent.id] = self.detect(ball, self.table, self.solver)
+                self.heap.push(agent.id, self.collisions[agent.id])
+
+    @staticmethod
+    @abstractmethod
+    def detect(ball: Ball, table: TableArrays, solver: QuarticSolver) -> Event:
+        """Returns the next collision between ball and this type of table object"""
+
+    @classmethod
+    def create(
+        cls,
+        shot: System,
+        solver: QuarticSolver = QuarticSolver.HYBRID,
+        table: Optional[TableArrays] = None,
+    ) -> BallCollisionCache:
+        if table is None:
+            table = TableArrays.create(shot.table)
+
+        return cls(
+            {
+                ball_id: cls.detect(ball, table, solver)
+                for ball_id, ball in shot.balls.items()
+            },
+            table,
+            solver,
+        )
+
+
+@attrs.define
+class LinearCushionCache(BallCollisionCache):
+    """Caches the next linear cushion collision of each ball"""
+
+    @staticmethod
+    def detect(ball: Ball, table: TableArrays, solver: QuarticSolver) -> Event:
+        return _next_ball_linear_cushion_collision_for_ball(ball, table)
+
+
+@attrs.define
+class CircularCushionCache(BallCollisionCache):
+    """Caches the next circular cushion collision of each ball"""
+
+    @staticmethod
+    def detect(ball: Ball, table: TableArrays, solver: QuarticSolver) -> Event:
+        return _next_ball_circular_cushion_collision_for_ball(ball, table, solver)
+
+
+@attrs.define
+class PocketCache(BallCollisionCache):
+    """Caches the next pocket collision of each ball"""
+
+    @staticmethod
+    def detect(ball: Ball, table: TableArrays, solver: QuarticSolver) -> Event:
+        return _next_ball_pocket_collision_for_ball(ball, table, solver)
+
+
+@attrs.define
+class BallBallCache:
+    """Caches the collision time of each tested ball pair
+
+    A pair's collision time only changes when one of its balls is involved in an
+    event, so it only needs to be recalculated then. Like BallCollisionCache.update,
+    `update` should be called for every event.
+    """
+
+    times: Dict[Tuple[str, str], float] = attrs.field(factory=dict)
+    pairs: Dict[str, Set[Tuple[str, str]]] = attrs.field(factory=dict)
+
+    def get(self, pair: Tuple[str, str]) -> Optional[float]:
+        return self.times.get(pair)
+
+    def set(self, pair: Tuple[str, str], time: float) -> None:
+        self.times[pair] = time
+        for ball_id in pair:
+            self.pairs.setdefault(ball_id, set()).add(pair)
+
+    def update(self, event: Event) -> None:
+        """Forget the collision times of all pairs involving balls in Event"""
+        for agent in event.agents:
+            if agent.agent_type == AgentType.BALL:
+                for pair in self.pairs.pop(agent.id, ()):
+                    self.times.pop(pair, None)
+
+
+@attrs.define
+class Broadphase(ABC):
+    """A broadphase for ball-ball collision detection
+
+    Nontranslating balls (stationary and spinning) are indexed by their position. These
+    balls don't move, so the index only needs updating when an event changes a ball's
+    state. Translating balls are tested against the indexed balls they could possibly
+    reach, rather than against every ball.
+
+    Attributes:
+        moving:
+            The IDs of translating balls. Like the index, this only changes when an
+            event changes a ball's state.
+        order:
+            The position of each ball ID in the system's balls.
+    """
+
+    moving: Set[str] = attrs.field(factory=set, kw_only=True)
+    order: Dict[str, int] = attrs.field(factory=dict, kw_only=True)
+
+    @property
+    @abstractmethod
+    def max_R(self) -> float:
+        """The largest ball radius"""
+
+    @abstractmethod
+    def add(self, ball: Ball) -> None:
+        """Add ball to the index if it is nontranslating"""
+
+    @abstractmethod
+    def remove(self, ball_id: str) -> None:
+        """Remove ball from the index (if present)"""
+
+    @abstractmethod
+    def query(self, x: float, y: float, radius: float) -> Iterator[str]:
+        """Yield IDs of all indexed balls whose center may be within radius of (x, y)"""
+
+    def track(self, ball: Ball) -> None:
+        """Add ball to the index or to the moving balls, depending on its state"""
+        if ball.state.s in const.nontranslating:
+            self.moving.discard(ball.id)
+            self.add(ball)
+        else:
+            self.moving.add(ball.id)
+
+    def update(self, event: Event) -> None:
+        """Update index membership and moving balls for all balls in Event"""
+        for agent in event.agents:
+            if agent.agent_type == AgentType.BALL:
+                assert isinstance(ball := agent.final, Ball)
+                self.remove(ball.id)
+                self.track(ball)
+
+    def populate(self, shot: System) -> None:
+        """Index or track every ball in the system"""
+        for idx, ball in enumerate(shot.balls.values()):
+            self.order[ball.id] = idx
+            self.track(ball)
+
+    @classmethod
+    @abstractmethod
+    def create(cls, shot: System) -> Broadphase:
+        """Create a broadphase indexing every ball in the system"""
+
+
+@attrs.define
+class CellGrid(Broadphase):
+    """A uniform grid broadphase
+
+    Nontranslating balls are binned by their center into square cells one ball diameter
+    wide.
+    """
+
+    width: float
+    cells: Dict[Tuple[int, int], Set[str]] = attrs.field(factory=dict)
+    locations: Dict[str, Tuple[int, int]] = attrs.field(factory=dict)
+
+    @property
+    def max_R(self) -> float:
+        return 0.5 * self.width
+
+    def _cell(self, ball: Ball) -> Tuple[int, int]:
+        return (
+            int(ball.state.rvw[0, 0] // self.width),
+            int(ball.state.rvw[0, 1] // self.width),
+        )
+
+    def add(self, ball: Ball) -> None:
+        if ball.state.s not in (const.stationary, const.spinning):
+            return
+
+        cell = self._cell(ball)
+        self.cells.setdefault(cell, set()).add(ball.id)
+        self.locations[ball.id] = cell
+
+    def remove(self, ball_id: str) -> None:
+        if (cell := self.locations.pop(ball_id, None)) is None:
+            return
+
+        self.cells[cell].discard(ball_id)
+        if not self.cells[cell]:
+            del self.cells[cell]
+
+    def query(self, x: float, y: float, radius: float) -> Iterator[str]:
+        if radius == np.inf:
+            num_cells = np.inf
+        else:
+            i_min = int((x - radius) // self.width)
+            i_max = int((x + radius) // self.width)
+            j_min = int((y - radius) // self.width)
+            j_max = int((y + radius) // self.width)
+            num_cells = (i_max - i_min + 1) * (j_max - j_min + 1)
+
+        if num_cells > len(self.cells):
+            # Cheaper to visit every occupied cell than every cell in range
+            for ball_ids in self.cells.values():
+                yield from ball_ids
+            return
+
+        for i in range(i_min, i_max + 1):
+            for j in range(j_min, j_max + 1):
+                yield from self.cells.get((i, j), ())
+
+    @classmethod
+    def create(cls, shot: System) -> CellGrid:
+        diameter = 2 * max((ball.params.R for ball in shot.balls.values()), default=1)
+        grid = cls(width=diameter)
+        grid.populate(shot)
+        return grid
+
+
+@attrs.define
+class SweepAndPrune(Broadphase):
+    """A sort-based broadphase
+
+    Nontranslating balls are kept sorted by the coordinate of their center along one
+    axis, chosen to be the long axis of the table. A query is then a binary search for
+    the balls within a range along that axis. Since only 1-2 balls change state per
+    event, the order is maintained with insertions and deletions, not by resorting.
+
+    Attributes:
+        axis:
+            0 to sort along x, 1 to sort along y.
+        keys:
+            The sorted coordinates of the indexed balls.
+        ids:
+            The IDs of the indexed balls, in the same order as `keys`.
+    """
+
+    axis: int
+    max_R: float
+    keys: List[float] = attrs.field(factory=list)
+    ids: List[str] = attrs.field(factory=list)
+    positions: Dict[str, float] = attrs.field(factory=dict)
+
+    def add(self, ball: Ball) -> None:
+        if ball.state.s not in (const.stationary, const.spinning):
+            return
+
+        key = float(ball.state.rvw[0, self.axis])
+        index = bisect.bisect_right(self.keys, key)
+        self.keys.insert(index, key)
+        self.ids.insert(index, ball.id)
+        self.positions[ball.id] = key
+
+    def remove(self, ball_id: str) -> None:
+        if (key := self.positions.pop(ball_id, None)) is None:
+            return
+
+        # Balls can share a key, so search from the first one that does
+        index = bisect.bisect_left(self.keys, key)
+        while self.ids[index] != ball_id:
+            index += 1
+
+        del self.keys[index]
+        del self.ids[index]
+
+    def query(self, x: float, y: float, radius: float) -> Iterator[str]:
+        center = y if self.axis else x
+        start = bisect.bisect_left(self.keys, center - radius)
+        stop = bisect.bisect_right(self.keys, center + radius)
+        yield from self.ids[start:stop]
+
+    @classmethod
+    def create(cls, shot: System) -> SweepAndPrune:
+        points = [
+            point
+            for cushion in shot.table.cushion_segments.linear.values()
+            for point in (cushion.p1, cushion.p2)
+        ]
+        if points:
+            extent = np.ptp(np.array(points), axis=0)
+            axis = int(extent[1] >= extent[0])
+        else:
+            axis = 1
+
+        R = max((ball.params.R for ball in shot.balls.values()), default=0.5)
+        sweep = cls(axis=axis, max_R=R)
+        sweep.populate(shot)
+        return sweep
+
+
+_BROADPHASES: Dict[BroadphaseType, Type[Broadphase]] = {
+    BroadphaseType.GRID: CellGrid,
+    BroadphaseType.SWEEP_AND_PRUNE: SweepAndPrune,
+}
+
+
 def _next_transition(ball: Ball) -> Event:
     if ball.state.s == const.stationary or ball.state.s == const.pocketed:
         return null_event(time=np.inf)
@@ -305,210 +872,413 @@ def _next_transition(ball: Ball) -> Event:
         raise NotImplementedError(f"Unknown '{ball.state.s=}'")
 
 
+def _reach(ball: Ball, horizon: float) -> float:
+    """Upper bound on how far a ball travels within horizon, given its current state"""
+    if ball.state.s in const.nontranslating:
+        return 0.0
+
+    if horizon == np.inf:
+        return np.inf
+
+    mu = ball.params.u_s if ball.state.s == const.sliding else ball.params.u_r
+    speed = ptmath.norm3d(ball.state.rvw[1])
+    return speed * horizon + 0.5 * mu * ball.params.g * horizon**2
+
+
+def _ball_ball_candidates(
+    balls: Tuple[Ball, ...], broadphase: Broadphase, horizon: float
+) -> List[Tuple[int, int]]:
+    """Returns index pairs of balls that could possibly collide within horizon
+
+    Pairs are ordered as they would be by `combinations(range(len(balls)), 2)`.
+    """
+    index = broadphase.order
+    moving = sorted(index[ball_id] for ball_id in broadphase.moving)
+
+    if not moving:
+        return []
+
+    # How far each moving ball's surface could get from its current center
+    bound = np.array(
+        [_reach(balls[idx], horizon) + balls[idx].params.R for idx in moving]
+    )
+    positions = np.array([balls[idx].state.rvw[0] for idx in moving])
+
+    # Moving balls are tested against each other all at once
+    pair_distance = np.sqrt(
+        ((positions[:, None, :] - positions[None, :, :]) ** 2).sum(-1)
+    )
+    close = pair_distance <= bound[:, None] + bound[None, :] + const.EPS_SPACE
+    rows, cols = np.nonzero(np.triu(close, k=1))
+    moving_idx = np.array(moving)
+    pairs = set(zip(moving_idx[rows].tolist(), moving_idx[cols].tolist()))
+
+    max_R = broadphase.max_R
+
+    for i, idx1 in enumerate(moving):
+        r1 = positions[i]
+        bound1 = bound[i] + const.EPS_SPACE
+
+        for ball2_id in broadphase.query(r1[0], r1[1], bound1 + max_R):
+            idx2 = index[ball2_id]
+            ball2 = balls[idx2]
+            distance = ptmath.norm3d(ball2.state.rvw[0] - r1)
+            if distance <= bound1 + ball2.params.R:
+                pairs.add((idx1, idx2) if idx1 < idx2 else (idx2, idx1))
+
+    return sorted(pairs)
+
+
 def get_next_ball_ball_collision(
-    shot: System, solver: QuarticSolver = QuarticSolver.HYBRID
+    shot: System,
+    solver: QuarticSolver = QuarticSolver.HYBRID,
+    broadphase: Optional[Broadphase] = None,
+    horizon: float = np.inf,
+    cache: Optional[BallBallCache] = None,
 ) -> Event:
-    """Returns next ball-ball collision"""
+    """Returns next ball-ball collision
+
+    Args:
+        broadphase:
+            If provided, only ball pairs that could possibly collide within `horizon`
+            are tested. Otherwise, every ball pair is tested.
+        horizon:
+            Collisions further than this amount of time into the future are allowed to
+            go undetected.
+        cache:
+            If provided, collision times of pairs already in the cache are reused, and
+            newly calculated collision times are added to it.
+    """
+    return _next_ball_ball_collision(shot, solver, broadphase, horizon, cache).build()
 
-    dtau_E = np.inf
-    ball_ids = []
-    collision_coeffs = []
 
-    for ball1, ball2 in combinations(shot.balls.values(), 2):
-        ball1_state = ball1.state
-        ball1_params = ball1.params
+def _next_ball_ball_collision(
+    shot: System,
+    solver: QuarticSolver = QuarticSolver.HYBRID,
+    broadphase: Optional[Broadphase] = None,
+    horizon: float = np.inf,
+    cache: Optional[BallBallCache] = None,
+) -> _Candidate:
+
+    balls = tuple(shot.balls.values())
+
+    pairs: Iterable[Tuple[int, int]]
+    if broadphase is None:
+        pairs = combinations(range(len(balls)), 2)
+    else:
+        pairs = _ball_ball_candidates(balls, broadphase, horizon)
 
-        ball2_state = ball2.state
-        ball2_params = ball2.params
+    candidates: List[Tuple[Ball, Ball]] = []
+    times: List[float] = []
+    uncached: List[int] = []
+    idx1 = []
+    idx2 = []
 
-        if ball1_state.s == const.pocketed or ball2_state.s == const.pocketed:
+    for i, j in pairs:
+        ball1, ball2 = balls[i], balls[j]
+
+        if cache is not None:
+            time = cache.get((ball1.id, ball2.id))
+            if time is not None:
+                candidates.append((ball1, ball2))
+                times.append(time)
+                continue
+
+        s1 = ball1.state.s
+        s2 = ball2.state.s
+
+        if s1 == const.pocketed or s2 == const.pocketed:
             continue
 
-        if (
-            ball1_state.s in const.nontranslating
-            and ball2_state.s in const.nontranslating
-        ):
+        if s1 in const.nontranslating and s2 in const.nontranslating:
             continue
 
         if (
-            ptmath.norm3d(ball1_state.rvw[0] - ball2_state.rvw[0])
-            < ball1_params.R + ball2_params.R
+            ptmath.norm3d(ball1.state.rvw[0] - ball2.state.rvw[0])
+            < ball1.params.R + ball2.params.R
         ):
             # If balls are intersecting, avoid internal collisions
             continue
 
-        collision_coeffs.append(
-            solve.ball_ball_collision_coeffs(
-                rvw1=ball1_state.rvw,
-                rvw2=ball2_state.rvw,
-                s1=ball1_state.s,
-                s2=ball2_state.s,
-                mu1=(
-                    ball1_params.u_s
-                    if ball1_state.s == const.sliding
-                    else ball1_params.u_r
-                ),
-                mu2=(
-                    ball2_params.u_s
-                    if ball2_state.s == const.sliding
-                    else ball2_params.u_r
-                ),
-                m1=ball1_params.m,
-                m2=ball2_params.m,
-                g1=ball1_params.g,
-                g2=ball2_params.g,
-                R=ball1_params.R,
-            )
+        uncached.append(len(candidates))
+        candidates.append((ball1, ball2))
+        times.append(np.inf)
+        idx1.append(i)
+        idx2.append(j)
+
+    if len(idx1):
+        rvws, s, mu, m, g, R = _stack_balls(balls)
+        collision_coeffs = solve.ball_ball_collision_coeffs_batched(
+            rvws=rvws,
+            s=s,
+            mu=mu,
+            m=m,
+            g=g,
+            R=R,
+            idx1=np.array(idx1, dtype=np.int64),
+            idx2=np.array(idx2, dtype=np.int64),
         )
 
-        ball_ids.append((ball1.id, ball2.id))
-
-    if not len(collision_coeffs):
-        # There are no collisions to test for
-        return ball_ball_collision(Ball.dummy(), Ball.dummy(), shot.t + dtau_E)
+        dtau_E = ptmath.roots.quartic.minimum_quartic_roots(
+            ps=collision_coeffs, solver=solver
+        )
 
-    dtau_E, index = ptmath.roots.quartic.minimum_quartic_root(
-        ps=np.array(collision_coeffs), solver=solver
-    )
+        for k, dtau in zip(uncached, dtau_E):
+            times[k] = shot.t + dtau
+            if cache is not None:
+                ball1, ball2 = candidates[k]
+                cache.set((ball1.id, ball2.id), times[k])
 
-    ball1_id, ball2_id = ball_ids[index]
-    ball1, ball2 = shot.balls[ball1_id], shot.balls[ball2_id]
+    if not len(candidates):
+        # There are no collisions to test for
+        return _Candidate(
+            shot.t + np.inf, ball_ball_collision, (_DUMMY_BALL, _DUMMY_BALL)
+        )
 
-    return ball_ball_collision(ball1, ball2, shot.t + dtau_E)
+    k = int(np.argmin(times))
+    return _Candidate(times[k], ball_ball_collision, candidates[k])
 
 
 def get_next_ball_circular_cushion_event(
     shot: System, solver: QuarticSolver = QuarticSolver.HYBRID
 ) -> Event:
     """Returns next ball-cushion collision (circular cushion segment)"""
+    return _next_ball_circular_cushion_collision(shot, solver).build()
 
-    dtau_E = np.inf
-    agent_ids = []
-    collision_coeffs = []
 
-    for ball in shot.balls.values():
-        if ball.state.s in const.nontranslating:
-            continue
+def _next_ball_circular_cushion_collision(
+    shot: System, solver: QuarticSolver = QuarticSolver.HYBRID
+) -> _Candidate:
+    balls = [
+        ball for ball in shot.balls.values() if ball.state.s not in const.nontranslating
+    ]
+    return _next_ball_circular_cushion_collision_for_balls(
+        balls, TableArrays.create(shot.table), solver, shot.t
+    )
+
+
+def _next_ball_circular_cushion_collision_for_ball(
+    ball: Ball,
+    table: TableArrays,
+    solver: QuarticSolver = QuarticSolver.HYBRID,
+) -> Event:
+    """Returns next collision between a ball and the table's circular cushions"""
+    balls = [ball] if ball.state.s not in const.nontranslating else []
+    return _next_ball_circular_cushion_collision_for_balls(
+        balls, table, solver, ball.state.t
+    ).build()
+
+
+def _next_ball_circular_cushion_collision_for_balls(
+    balls: List[Ball],
+    table: TableArrays,
+    solver: QuarticSolver,
+    t: float,
+) -> _Candidate:
 
-        state = ball.state
-        params = ball.params
-
-        for cushion in shot.table.cushion_segments.circular.values():
-            collision_coeffs.append(
-                solve.ball_circular_cushion_collision_coeffs(
-                    rvw=state.rvw,
-                    s=state.s,
-                    a=cushion.a,
-                    b=cushion.b,
-                    r=cushion.radius,
-                    mu=(params.u_s if state.s == const.sliding else params.u_r),
-                    m=params.m,
-                    g=params.g,
-                    R=params.R,
-                )
-            )
-
-            agent_ids.append((ball.id, cushion.id))
-
-    if not len(collision_coeffs):
+    dtau_E = np.inf
+    cushions = table.circular
+
+    if not len(balls) or not len(cushions):
         # There are no collisions to test for
-        return ball_circular_cushion_collision(
-            Ball.dummy(), CircularCushionSegment.dummy(), shot.t + dtau_E
+        return _Candidate(
+            t + dtau_E,
+            ball_circular_cushion_collision,
+            (_DUMMY_BALL, _DUMMY_CIRCULAR_CUSHION),
         )
 
-    dtau_E, index = ptmath.roots.quartic.minimum_quartic_root(
-        ps=np.array(collision_coeffs), solver=solver
+    rvws, s, mu, m, g, R = _stack_balls(balls)
+    collision_coeffs = solve.ball_circular_cushion_collision_coeffs_batched(
+        rvws=rvws,
+        s=s,
+        mu=mu,
+        m=m,
+        g=g,
+        R=R,
+        circles=table.circles,
     )
 
-    ball_id, cushion_id = agent_ids[index]
-    ball, cushion = (
-        shot.balls[ball_id],
-        shot.table.cushion_segments.circular[cushion_id],
+    dtau_E, index = ptmath.roots.quartic.minimum_quartic_root(
+        ps=collision_coeffs, solver=solver
     )
 
-    return ball_circular_cushion_collision(ball, cushion, shot.t + dtau_E)
+    ball_idx, cushion_idx = divmod(index, len(cushions))
+    ball, cushion = balls[ball_idx], cushions[cushion_idx]
 
+    return _Candidate(t + dtau_E, ball_circular_cushion_collision, (ball, cushion))
 
-def get_next_ball_linear_cushion_collision(shot: System) -> Event:
+
+def get_next_ball_linear_cushion_collision(
+    shot: System, cache: Optional[LinearCushionCache] = None
+) -> Event:
     """Returns next ball-cushion collision (linear cushion segment)"""
 
+    if cache is not None:
+        return cache.get_next()
+
     dtau_E_min = np.inf
-    involved_agents = (Ball.dummy(), LinearCushionSegment.dummy())
+    event = ball_linear_cushion_collision(
+        _DUMMY_BALL, _DUMMY_LINEAR_CUSHION, shot.t + dtau_E_min
+    )
+
+    table = TableArrays.create(shot.table)
 
     for ball in shot.balls.values():
         if ball.state.s in const.nontranslating:
             continue
 
-        state = ball.state
-        params = ball.params
+        ball_event = _next_ball_linear_cushion_collision_for_ball(ball, table, t=shot.t)
 
-        for cushion in shot.table.cushion_segments.linear.values():
-            dtau_E = solve.ball_linear_cushion_collision_time(
-                rvw=state.rvw,
-                s=state.s,
-                lx=cushion.lx,
-                ly=cushion.ly,
-                l0=cushion.l0,
-                p1=cushion.p1,
-                p2=cushion.p2,
-                direction=cushion.direction,
-                mu=(params.u_s if state.s == const.sliding else params.u_r),
-                m=params.m,
-                g=params.g,
-                R=params.R,
-            )
+        if ball_event.time < event.time:
+            event = ball_event
 
-            if dtau_E < dtau_E_min:
-                involved_agents = (ball, cushion)
-                dtau_E_min = dtau_E
+    return event
 
-    dtau_E = dtau_E_min
 
-    return ball_linear_cushion_collision(*involved_agents, shot.t + dtau_E)
+def _next_ball_linear_cushion_collision_for_ball(
+    ball: Ball,
+    table: TableArrays,
+    t: Optional[float] = None,
+) -> Event:
+    """Returns next collision between a ball and the table's linear cushions
+
+    Args:
+        t:
+            The current time. If None, the time of the ball's state is used.
+    """
+    if t is None:
+        t = ball.state.t
+
+    dtau_E_min = np.inf
+    cushions = table.linear
+
+    if ball.state.s in const.nontranslating or not len(cushions):
+        return ball_linear_cushion_collision(
+            _DUMMY_BALL, _DUMMY_LINEAR_CUSHION, t + dtau_E_min
+        )
+
+    state = ball.state
+    params = ball.params
+
+    dtau_E = solve.ball_linear_cushion_collision_times(
+        rvw=state.rvw,
+        s=state.s,
+        lines=table.lines,
+        p1=table.p1,
+        p2=table.p2,
+        direction=table.direction,
+        mu=(params.u_s if state.s == const.sliding else params.u_r),
+        m=params.m,
+        g=params.g,
+        R=params.R,
+    )
+
+    index = int(np.argmin(dtau_E))
+    dtau_E_min = dtau_E[index]
+
+    if dtau_E_min == np.inf:
+        return ball_linear_cushion_collision(
+            _DUMMY_BALL, _DUMMY_LINEAR_CUSHION, t + dtau_E_min
+        )
+
+    return ball_linear_cushion_collision(ball, cushions[index], t + dtau_E_min)
 
 
 def get_next_ball_pocket_collision(
     shot: System, solver: QuarticSolver = QuarticSolver.HYBRID
 ) -> Event:
     """Returns next ball-pocket collision"""
+    return _next_ball_pocket_collision(shot, solver).build()
 
-    dtau_E = np.inf
-    agent_ids = []
-    collision_coeffs = []
 
-    for ball in shot.balls.values():
-        if ball.state.s in const.nontranslating:
-            continue
+def _next_ball_pocket_collision(
+    shot: System, solver: QuarticSolver = QuarticSolver.HYBRID
+) -> _Candidate:
+    balls = [
+        ball for ball in shot.balls.values() if ball.state.s not in const.nontranslating
+    ]
+    return _next_ball_pocket_collision_for_balls(
+        balls, TableArrays.create(shot.table), solver, shot.t
+    )
 
-        state = ball.state
-        params = ball.params
-
-        for pocket in shot.table.pockets.values():
-            collision_coeffs.append(
-                solve.ball_pocket_collision_coeffs(
-                    rvw=state.rvw,
-                    s=state.s,
-                    a=pocket.a,
-                    b=pocket.b,
-                    r=pocket.radius,
-                    mu=(params.u_s if state.s == const.sliding else params.u_r),
-                    m=params.m,
-                    g=params.g,
-                    R=params.R,
-                )
-            )
-
-            agent_ids.append((ball.id, pocket.id))
-
-    if not len(collision_coeffs):
+
+def _next_ball_pocket_collision_for_ball(
+    ball: Ball,
+    table: TableArrays,
+    solver: QuarticSolver = QuarticSolver.HYBRID,
+) -> Event:
+    """Returns next collision between a ball and the table's pockets"""
+    balls = [ball] if ball.state.s not in const.nontranslating else []
+    return _next_ball_pocket_collision_for_balls(
+        balls, table, solver, ball.state.t
+    ).build()
+
+
+def _next_ball_pocket_collision_for_balls(
+    balls: List[Ball],
+    table: TableArrays,
+    solver: QuarticSolver,
+    t: float,
+) -> _Candidate:
+
+    dtau_E = np.inf
+    pockets = table.pockets
+
+    if not len(balls) or not len(pockets):
         # There are no collisions to test for
-        return ball_pocket_collision(Ball.dummy(), Pocket.dummy(), shot.t + dtau_E)
+        return _Candidate(
+            t + dtau_E, ball_pocket_collision, (_DUMMY_BALL, _DUMMY_POCKET)
+        )
+
+    rvws, s, mu, m, g, R = _stack_balls(balls)
+    collision_coeffs = solve.ball_pocket_collision_coeffs_batched(
+        rvws=rvws,
+        s=s,
+        mu=mu,
+        m=m,
+        g=g,
+        R=R,
+        circles=table.pocket_circles,
+    )
 
     dtau_E, index = ptmath.roots.quartic.minimum_quartic_root(
-        ps=np.array(collision_coeffs), solver=solver
+        ps=collision_coeffs, solver=solver
     )
 
-    ball_id, pocket_id = agent_ids[index]
-    ball, pocket = shot.balls[ball_id], shot.table.pockets[pocket_id]
+    ball_idx, pocket_idx = divmod(index, len(pockets))
+    ball, pocket = balls[ball_idx], pockets[pocket_idx]
+
+    return _Candidate(t + dtau_E, ball_pocket_collision, (ball, pocket))
+
 
-    return ball_pocket_collision(ball, pocket, shot.t + dtau_E)
+def _stack_balls(
+    balls: Sequence[Ball],
+) -> Tuple[
+    NDArray[np.float64],
+    NDArray[np.int64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+    NDArray[np.float64],
+]:
+    """Stack ball attributes for the batched collision functions in `solve`
+
+    Returns:
+        (rvws, s, mu, m, g, R):
+            rvws is a Nx3x3 array, and the rest are length-N arrays. mu is the
+            coefficient of friction for the ball's current motion state.
+    """
+    return (
+        np.stack([ball.state.rvw for ball in balls]),
+        np.array([ball.state.s for ball in balls], dtype=np.int64),
+        np.array(
+            [
+                ball.params.u_s if ball.state.s == const.sliding else ball.params.u_r
+                for ball in balls
+            ],
+            dtype=np.float64,
+        ),
+        np.array([ball.params.m for ball in balls], dtype=np.float64),
+        np.array([ball.params.g for ball in balls], dtype=np.float64),
+        np.array([ball.params.R for ball in balls], dtype=np.float64),
+    )
@@ -140,6 +140,41 @@ def ball_ball_collision_coeffs(rvw1, rvw2, s1, s2, mu1, mu2, m1, m2, g1, g2, R):
     return a, b, c, d, e
 
 
+@jit(nopython=True, cache=const.use_numba_cache)
+def ball_ball_collision_coeffs_batched(rvws, s, mu, m, g, R, idx1, idx2):
+    """Get quartic coeffs required to determine many ball-ball collision times
+
+    (just-in-time compiled)
+
+    Args:
+        rvws:
+            A Nx3x3 array of ball rvw arrays.
+        s, mu, m, g, R:
+            Length-N arrays of each ball's motion state, coefficient of friction (for
+            its current motion state), mass, gravitational constant, and radius.
+        idx1, idx2:
+            Length-P arrays of ball indices. Each pair (idx1[k], idx2[k]) defines a ball
+            pair whose coefficients are calculated.
+
+    Returns:
+        A Px5 array of quartic coefficients, one row per ball pair.
+    """
+    coeffs = np.empty((len(idx1), 5), dtype=np.float64)
+
+    for k in range(len(idx1)):
+        i, j = idx1[k], idx2[k]
+        a, b, c, d, e = ball_ball_collision_coeffs(
+            rvws[i], rvws[j], s[i], s[j], mu[i], mu[j], m[i], m[j], g[i], g[j], R[i]
+        )
+        coeffs[k, 0] = a
+        coeffs[k, 1] = b
+        coeffs[k, 2] = c
+        coeffs[k, 3] = d
+        coeffs[k, 4] = e
+
+    return coeffs
+
+
 def ball_ball_collision_time(rvw1, rvw2, s1, s2, mu1, mu2, m1, m2, g1, g2, R):
     """Get the time until collision between 2 balls
 
@@ -264,6 +299,35 @@ def ball_linear_cushion_collision_time(
     return min_time
 
 
+@jit(nopython=True, cache=const.use_numba_cache)
+def ball_linear_cushion_collision_times(rvw, s, lines, p1, p2, direction, mu, m, g, R):
+    """Get times until collision between ball and many linear cushion segments
+
+    (just-in-time compiled)
+
+    Args:
+        lines:
+            A Mx3 array of linear cushion segment line coefficients. Each row is (lx,
+            ly, l0).
+        p1, p2:
+            Mx3 arrays of linear cushion segment endpoints.
+        direction:
+            A length-M array of linear cushion segment directions.
+
+    Returns:
+        A length-M array of collision times.
+    """
+    times = np.empty(len(lines), dtype=np.float64)
+
+    for j in range(len(lines)):
+        lx, ly, l0 = lines[j]
+        times[j] = ball_linear_cushion_collision_time(
+            rvw, s, lx, ly, l0, p1[j], p2[j], direction[j], mu, m, g, R
+        )
+
+    return times
+
+
 @jit(nopython=True, cache=const.use_numba_cache)
 def ball_circular_cushion_collision_coeffs(rvw, s, a, b, r, mu, m, g, R):
     """Get quartic coeffs required to determine the ball-circular-cushion collision time
@@ -297,6 +361,44 @@ def ball_circular_cushion_collision_coeffs(rvw, s, a, b, r, mu, m, g, R):
     return A, B, C, D, E
 
 
+@jit(nopython=True, cache=const.use_numba_cache)
+def ball_circular_cushion_collision_coeffs_batched(rvws, s, mu, m, g, R, circles):
+    """Get quartic coeffs for every ball-circular-cushion pair
+
+    (just-in-time compiled)
+
+    Args:
+        rvws:
+            A Nx3x3 array of ball rvw arrays.
+        s, mu, m, g, R:
+            Length-N arrays of ball attributes.
+        circles:
+            A Mx3 array of circular cushion segment circles. Each row is (a, b, r),
+            where (a, b) is the center and r is the radius.
+
+    Returns:
+        A (N*M)x5 array of quartic coefficients. Row i*M + j corresponds to the ith
+        ball and the jth cushion segment.
+    """
+    num_cushions = len(circles)
+    coeffs = np.empty((len(s) * num_cushions, 5), dtype=np.float64)
+
+    for i in range(len(s)):
+        for j in range(num_cushions):
+            a, b, r = circles[j]
+            A, B, C, D, E = ball_circular_cushion_collision_coeffs(
+                rvws[i], s[i], a, b, r, mu[i], m[i], g[i], R[i]
+            )
+            k = i * num_cushions + j
+            coeffs[k, 0] = A
+            coeffs[k, 1] = B
+            coeffs[k, 2] = C
+            coeffs[k, 3] = D
+            coeffs[k, 4] = E
+
+    return coeffs
+
+
 @jit(nopython=True, cache=const.use_numba_cache)
 def ball_pocket_collision_coeffs(rvw, s, a, b, r, mu, m, g, R):
     """Get quartic coeffs required to determine the ball-pocket collision time
@@ -328,3 +430,41 @@ def ball_pocket_collision_coeffs(rvw, s, a, b, r, mu, m, g, R):
     E = 0.5 * (a**2 + b**2 + cx**2 + cy**2 - r**2) - (cx * a + cy * b)
 
     return A, B, C, D, E
+
+
+@jit(nopython=True, cache=const.use_numba_cache)
+def ball_pocket_collision_coeffs_batched(rvws, s, mu, m, g, R, circles):
+    """Get quartic coeffs for every ball-pocket pair
+
+    (just-in-time compiled)
+
+    Args:
+        rvws:
+            A Nx3x3 array of ball rvw arrays.
+        s, mu, m, g, R:
+            Length-N arrays of ball attributes.
+        circles:
+            A Mx3 array of pocket circles. Each row is (a, b, r), where (a, b) is
+            the center and r is the radius.
+
+    Returns:
+        A (N*M)x5 array of quartic coefficients. Row i*M + j corresponds to the ith
+        ball and the jth pocket.
+    """
+    num_pockets = len(circles)
+    coeffs = np.empty((len(s) * num_pockets, 5), dtype=np.float64)
+
+    for i in range(len(s)):
+        for j in range(num_pockets):
+            a, b, r = circles[j]
+            A, B, C, D, E = ball_pocket_collision_coeffs(
+                rvws[i], s[i], a, b, r, mu[i], m[i], g[i], R[i]
+            )
+            k = i * num_pockets + j
+            coeffs[k, 0] = A
+            coeffs[k, 1] = B
+            coeffs[k, 2] = C
+            coeffs[k, 3] = D
+            coeffs[k, 4] = E
+
+    return coeffs
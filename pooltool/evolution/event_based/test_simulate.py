@@ -1,3 +1,6 @@
+from itertools import combinations
+from typing import List
+
 import numpy as np
 import pytest
 from numpy.typing import NDArray
@@ -5,15 +8,40 @@ from numpy.typing import NDArray
 import pooltool.constants as const
 import pooltool.physics.utils as physics_utils
 import pooltool.ptmath as ptmath
-from pooltool.events import EventType, ball_ball_collision, ball_pocket_collision
+from pooltool.events import (
+    EventType,
+    ball_ball_collision,
+    ball_pocket_collision,
+    null_event,
+    stick_ball_collision,
+)
 from pooltool.evolution.event_based.simulate import (
+    BallBallCache,
+    CellGrid,
+    EventHeap,
+    SweepAndPrune,
+    TableArrays,
+    TransitionCache,
+    _evolve,
+    _stack_balls,
     get_next_ball_ball_collision,
     get_next_event,
     simulate,
 )
-from pooltool.evolution.event_based.solve import ball_ball_collision_coeffs
+from pooltool.evolution.event_based.solve import (
+    ball_ball_collision_coeffs,
+    ball_ball_collision_coeffs_batched,
+    ball_circular_cushion_collision_coeffs,
+    ball_circular_cushion_collision_coeffs_batched,
+    ball_linear_cushion_collision_time,
+    ball_linear_cushion_collision_times,
+    ball_pocket_collision_coeffs,
+    ball_pocket_collision_coeffs_batched,
+)
 from pooltool.evolution.event_based.test_data import TEST_DIR
+from pooltool.game.layouts import get_nine_ball_rack
 from pooltool.objects import Ball, BilliardTableSpecs, Cue, Table
+from pooltool.physics.engine import PhysicsEngine
 from pooltool.ptmath.roots import quadratic, quartic
 from pooltool.system import System
 
@@ -480,3 +508,207 @@ def test_no_ball_ball_collisions_for_intersecting_balls(solver: quartic.QuarticS
         get_next_event(system, quartic_solver=solver).event_type != EventType.BALL_BALL
     )
     assert get_next_ball_ball_collision(system, solver=solver).time == np.inf
+
+
+@pytest.mark.parametrize("broadphase_cls", [CellGrid, SweepAndPrune])
+def test_broadphase_matches_brute_force(broadphase_cls):
+    """The broadphase finds the same ball-ball collisions as testing every pair"""
+    shot = System(
+        cue=Cue(cue_ball_id="cue"),
+        table=(table := Table.default()),
+        balls=get_nine_ball_rack(table, spacing_factor=1e-3, seed=42),
+    )
+    shot.strike(V0=8, phi=ptmath.angle(shot.balls["1"].xyz - shot.balls["cue"].xyz))
+
+    engine = PhysicsEngine()
+    event = stick_ball_collision(shot.cue, shot.balls["cue"], time=0, set_initial=True)
+    engine.resolver.resolve(shot, event)
+    shot.update_history(event)
+
+    transition_cache = TransitionCache.create(shot)
+    broadphase = broadphase_cls.create(shot)
+
+    while True:
+        horizon = transition_cache.get_next().time - shot.t
+        brute_force = get_next_ball_ball_collision(shot)
+        pruned = get_next_ball_ball_collision(
+            shot, broadphase=broadphase, horizon=horizon
+        )
+
+        if brute_force.time - shot.t < horizon:
+            assert pruned.ids == brute_force.ids
+            assert pruned.time == brute_force.time
+
+        event = get_next_event(
+            shot, transition_cache=transition_cache, broadphase=broadphase
+        )
+        if event.time == np.inf:
+            break
+
+        _evolve(shot, event.time - shot.t)
+        engine.resolver.resolve(shot, event)
+        transition_cache.update(event)
+        broadphase.update(event)
+        shot.update_history(event)
+
+        assert broadphase.moving == {
+            ball.id
+            for ball in shot.balls.values()
+            if ball.state.s not in const.nontranslating
+        }
+
+
+def test_event_heap():
+    heap = EventHeap.from_dict({"a": null_event(3), "b": null_event(2)})
+    assert heap.peek().time == 2
+
+    # Outdated entries are ignored
+    heap.push("b", null_event(4))
+    assert heap.peek() is heap.events["a"]
+
+    # Ties go to the key pushed first
+    heap.push("c", null_event(1))
+    heap.push("a", null_event(1))
+    assert heap.peek() is heap.events["a"]
+
+    heap.push("a", null_event(np.inf))
+    heap.push("b", null_event(np.inf))
+    heap.push("c", null_event(np.inf))
+    assert heap.peek().time == np.inf
+
+
+def test_ball_ball_cache():
+    shot = System.example()
+    shot.strike(V0=2, phi=ptmath.angle(shot.balls["1"].xyz - shot.balls["cue"].xyz))
+    PhysicsEngine().resolver.resolve(
+        shot, stick_ball_collision(shot.cue, shot.balls["cue"], time=0)
+    )
+
+    cache = BallBallCache()
+    uncached = get_next_ball_ball_collision(shot)
+    cached = get_next_ball_ball_collision(shot, cache=cache)
+    assert cached.ids == uncached.ids
+    assert cached.time == uncached.time
+    assert cache.get(("cue", "1")) == uncached.time
+
+    # Cached collision times are reused
+    assert get_next_ball_ball_collision(shot, cache=cache).time == uncached.time
+
+    # Pairs involving a ball in an event are forgotten
+    cache.update(null_event(0))
+    assert cache.get(("cue", "1")) == uncached.time
+    cache.update(uncached)
+    assert cache.get(("cue", "1")) is None
+
+
+def _balls_in_each_motion_state() -> List[Ball]:
+    """Returns a sliding, a rolling, a spinning, and a stationary ball"""
+    sliding = Ball.create("sliding", xy=(0.3, 0.4))
+    sliding.state.rvw[1] = [1.2, 0.3, 0.0]
+    sliding.state.rvw[2] = [5.0, -20.0, 15.0]
+    sliding.state.s = const.sliding
+
+    rolling = Ball.create("rolling", xy=(0.6, 1.2))
+    R = rolling.params.R
+    rolling.state.rvw[1] = [-0.5, -0.8, 0.0]
+    rolling.state.rvw[2] = [0.8 / R, -0.5 / R, 0.0]
+    rolling.state.s = const.rolling
+
+    spinning = Ball.create("spinning", xy=(0.8, 0.5))
+    spinning.state.rvw[2] = [0.0, 0.0, 8.0]
+    spinning.state.s = const.spinning
+
+    stationary = Ball.create("stationary", xy=(0.2, 1.6))
+
+    return [sliding, rolling, spinning, stationary]
+
+
+def test_ball_ball_collision_coeffs_batched():
+    balls = _balls_in_each_motion_state()
+    rvws, s, mu, m, g, R = _stack_balls(balls)
+
+    pairs = list(combinations(range(len(balls)), 2))
+    idx1 = np.array([i for i, _ in pairs], dtype=np.int64)
+    idx2 = np.array([j for _, j in pairs], dtype=np.int64)
+
+    coeffs = ball_ball_collision_coeffs_batched(rvws, s, mu, m, g, R, idx1, idx2)
+    assert coeffs.shape == (len(pairs), 5)
+
+    for k, (i, j) in enumerate(pairs):
+        expected = ball_ball_collision_coeffs(
+            rvw1=rvws[i],
+            rvw2=rvws[j],
+            s1=s[i],
+            s2=s[j],
+            mu1=mu[i],
+            mu2=mu[j],
+            m1=m[i],
+            m2=m[j],
+            g1=g[i],
+            g2=g[j],
+            R=R[i],
+        )
+        assert np.array_equal(coeffs[k], np.array(expected, dtype=np.float64))
+
+
+def test_ball_table_collision_kernels_batched():
+    balls = _balls_in_each_motion_state()
+    table = TableArrays.create(Table.default())
+    rvws, s, mu, m, g, R = _stack_balls(balls)
+
+    circular_coeffs = ball_circular_cushion_collision_coeffs_batched(
+        rvws, s, mu, m, g, R, table.circles
+    )
+    pocket_coeffs = ball_pocket_collision_coeffs_batched(
+        rvws, s, mu, m, g, R, table.pocket_circles
+    )
+
+    num_circular = len(table.circles)
+    num_pockets = len(table.pocket_circles)
+    assert circular_coeffs.shape == (len(balls) * num_circular, 5)
+    assert pocket_coeffs.shape == (len(balls) * num_pockets, 5)
+
+    for i in range(len(balls)):
+        # Row i*M + j corresponds to the ith ball and the jth table object
+        for j, (a, b, r) in enumerate(table.circles):
+            expected = ball_circular_cushion_collision_coeffs(
+                rvws[i], s[i], a, b, r, mu[i], m[i], g[i], R[i]
+            )
+            assert np.array_equal(circular_coeffs[i * num_circular + j], expected)
+
+        for j, (a, b, r) in enumerate(table.pocket_circles):
+            expected = ball_pocket_collision_coeffs(
+                rvws[i], s[i], a, b, r, mu[i], m[i], g[i], R[i]
+            )
+            assert np.array_equal(pocket_coeffs[i * num_pockets + j], expected)
+
+        times = ball_linear_cushion_collision_times(
+            rvws[i],
+            s[i],
+            table.lines,
+            table.p1,
+            table.p2,
+            table.direction,
+            mu[i],
+            m[i],
+            g[i],
+            R[i],
+        )
+        assert times.shape == (len(table.lines),)
+
+        for j, (lx, ly, l0) in enumerate(table.lines):
+            expected = ball_linear_cushion_collision_time(
+                rvws[i],
+                s[i],
+                lx,
+                ly,
+                l0,
+                table.p1[j],
+                table.p2[j],
+                table.direction[j],
+                mu[i],
+                m[i],
+                g[i],
+                R[i],
+            )
+            assert times[j] == expected
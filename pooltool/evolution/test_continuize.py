@@ -1,5 +1,9 @@
-from pooltool.evolution.continuize import continuize
+import pooltool.ptmath as ptmath
+from pooltool.events import EventType, filter_ball
+from pooltool.evolution.continuize import _events_by_ball, continuize
 from pooltool.evolution.event_based.simulate import simulate
+from pooltool.game.layouts import get_nine_ball_rack
+from pooltool.objects import Cue, Table
 from pooltool.system import System
 
 
@@ -30,3 +34,30 @@ def test_continuize_inplace():
 
     # They are the same object
     assert continuized_system is system
+
+
+def test_events_by_ball():
+    # Simulate a break
+    system = System(
+        cue=Cue(cue_ball_id="cue"),
+        table=(table := Table.default()),
+        balls=get_nine_ball_rack(table, spacing_factor=1e-3, seed=42),
+    )
+    system.strike(
+        V0=8, phi=ptmath.angle(system.balls["1"].xyz - system.balls["cue"].xyz)
+    )
+    simulate(system, inplace=True)
+
+    events_by_ball = _events_by_ball(system)
+    assert events_by_ball.keys() == system.balls.keys()
+
+    for ball_id, ball in system.balls.items():
+        expected = filter_ball(system.events, ball_id, keep_nonevent=True)
+        assert [event for event, _ in events_by_ball[ball_id]] == expected
+
+        # Each event is paired with the ball's agent, and null events with None
+        for event, agent in events_by_ball[ball_id]:
+            if event.event_type == EventType.NONE:
+                assert agent is None
+            else:
+                assert agent is not None and agent.matches(ball)
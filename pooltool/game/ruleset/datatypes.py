@@ -2,12 +2,11 @@
 from __future__ import annotations
 
 import copy
+import datetime
 from abc import ABC, abstractmethod
 from typing import (
-    Any,
     Callable,
     Counter,
-    Dict,
     Generator,
     List,
     Optional,
@@ -36,7 +35,7 @@ class AIPlayer(Protocol):
         ...
 
 
-@attrs.define
+@attrs.define(weakref_slot=False)
 class Player:
     name: str
     ai: Optional[AIPlayer] = None
@@ -46,27 +45,49 @@ class Player:
         return self.ai is not None
 
 
+@attrs.define(weakref_slot=False)
+class LogMsg:
+    """A game log message
+
+    Attributes:
+        elapsed:
+            The time elapsed between the start of the game and the message. It is
+            formatted for display with `Log.elapsed`.
+    """
+
+    time: datetime.datetime
+    elapsed: datetime.timedelta
+    msg: str
+    quiet: bool = attrs.field(default=False)
+    sentiment: str = attrs.field(default="neutral")
+    broadcast: bool = attrs.field(default=False)
+
+
 @attrs.define
 class Log:
-    msgs: List[Dict[str, Any]] = attrs.field(factory=list)
+    msgs: List[LogMsg] = attrs.field(factory=list)
     timer: Timer = attrs.field(factory=Timer.factory)
     update: bool = attrs.field(default=False)
 
     def add_msg(self, msg, sentiment="neutral", quiet=False) -> None:
+        time = self.timer.timestamp()
         self.msgs.append(
-            {
-                "time": self.timer.timestamp(),
-                "elapsed": self.timer.time_elapsed(fmt="{minutes}:{seconds}"),
-                "msg": msg,
-                "quiet": quiet,
-                "sentiment": sentiment,
-                "broadcast": False,
-            }
+            LogMsg(
+                time=time,
+                elapsed=self.timer.timedelta_to_checkpoint(time),
+                msg=msg,
+                quiet=quiet,
+                sentiment=sentiment,
+            )
         )
 
         if not quiet:
             self.update = True
 
+    def elapsed(self, msg: LogMsg) -> str:
+        """Format the time elapsed between the start of the game and the message"""
+        return self.timer.format_time(msg.elapsed, fmt="{minutes}:{seconds}")
+
     def copy(self) -> Log:
         return attrs.evolve(
             self,
@@ -75,6 +96,11 @@ class Log:
         )
 
 
+# Ball IDs that are assumed to be the cue ball, in order of preference, when no
+# cueable balls are specified
+CUEBALL_IDS = ("cue", "white", "yellow")
+
+
 class BallInHandOptions(StrEnum):
     NONE = auto()
     ANYWHERE = auto()
@@ -82,7 +108,7 @@ class BallInHandOptions(StrEnum):
     SEMICIRCLE = auto()
 
 
-@attrs.define
+@attrs.define(weakref_slot=False)
 class ShotConstraints:
     """Constraints for a yet-to-happen shot
 
@@ -119,16 +145,16 @@ class ShotConstraints:
     pocket_call: Optional[str] = attrs.field(default=None)
 
     def cueball(self, balls: Balls) -> str:
-        if self.cueable is None:
-            assert len(balls)
+        if self.cueable is not None:
+            return self.cueable[0]
 
-            for cue in ("cue", "white", "yellow"):
-                if cue in balls:
-                    return cue
+        assert len(balls)
 
-            return list(balls.keys())[0]
+        for cue in CUEBALL_IDS:
+            if cue in balls:
+                return cue
 
-        return self.cueable[0]
+        return next(iter(balls))
 
     def can_shoot(self) -> bool:
         if (
@@ -143,7 +169,7 @@ class ShotConstraints:
             return False
 
 
-@attrs.define(frozen=True)
+@attrs.define(frozen=True, weakref_slot=False)
 class ShotInfo:
     player: Player
     legal: bool
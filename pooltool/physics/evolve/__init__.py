@@ -60,6 +60,37 @@ def evolve_ball_motion(state, rvw, R, m, u_s, u_sp, u_r, g, t):
             return evolve_perpendicular_spin_state(rvw, R, u_sp, g, t), const.spinning
 
 
+@jit(nopython=True, cache=const.use_numba_cache)
+def evolve_ball_motion_batched(states, rvws, params, t):
+    """Evolve the motion of many balls an amount of time t
+
+    Args:
+        states:
+            A length-N array of ball motion states.
+        rvws:
+            A Nx3x3 array of ball rvw arrays.
+        params:
+            A Nx6 array of ball parameters. The columns are R, m, u_s, u_sp, u_r, and g.
+        t:
+            The amount of time to evolve each ball.
+
+    Returns:
+        (rvws, states):
+            The evolved rvw arrays and motion states.
+    """
+    num_balls = len(states)
+    new_rvws = np.empty((num_balls, 3, 3), dtype=np.float64)
+    new_states = np.empty(num_balls, dtype=np.int64)
+
+    for i in range(num_balls):
+        R, m, u_s, u_sp, u_r, g = params[i]
+        rvw, state = evolve_ball_motion(states[i], rvws[i], R, m, u_s, u_sp, u_r, g, t)
+        new_rvws[i] = rvw
+        new_states[i] = state
+
+    return new_rvws, new_states
+
+
 @jit(nopython=True, cache=const.use_numba_cache)
 def evolve_slide_state(rvw, R, m, u_s, u_sp, g, t):
     if t == 0:
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+import pooltool.constants as const
+from pooltool.objects.ball.params import BallParams
+from pooltool.physics.evolve import evolve_ball_motion, evolve_ball_motion_batched
+
+
+@pytest.mark.parametrize("t", [0.0, 0.05, 0.3, 5.0])
+def test_evolve_ball_motion_batched(t: float):
+    params = BallParams.default()
+    R = params.R
+
+    states = np.array(
+        [
+            const.sliding,
+            const.rolling,
+            const.spinning,
+            const.stationary,
+            const.pocketed,
+        ],
+        dtype=np.int64,
+    )
+    rvws = np.array(
+        [
+            # Sliding with draw and sidespin
+            [[0.5, 0.5, R], [1.2, 0.3, 0.0], [5.0, -20.0, 15.0]],
+            # Rolling slowly enough to stop within the longer times
+            [[0.2, 0.9, R], [0.0, 0.4, 0.0], [-0.4 / R, 0.0, 2.0]],
+            # Spinning in place
+            [[0.7, 0.3, R], [0.0, 0.0, 0.0], [0.0, 0.0, 8.0]],
+            [[0.3, 1.5, R], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]],
+            [[0.0, 2.0, -R], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]],
+        ],
+        dtype=np.float64,
+    )
+    param_array = np.tile(
+        [params.R, params.m, params.u_s, params.u_sp, params.u_r, params.g],
+        (len(states), 1),
+    )
+
+    batched_rvws, batched_states = evolve_ball_motion_batched(
+        states, rvws, param_array, t
+    )
+
+    for i in range(len(states)):
+        rvw, state = evolve_ball_motion(
+            state=states[i],
+            rvw=rvws[i],
+            R=params.R,
+            m=params.m,
+            u_s=params.u_s,
+            u_sp=params.u_sp,
+            u_r=params.u_r,
+            g=params.g,
+            t=t,
+        )
+        assert batched_states[i] == state
+        assert np.array_equal(batched_rvws[i], rvw)
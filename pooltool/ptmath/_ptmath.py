@@ -1,4 +1,4 @@
-from math import degrees, sqrt
+from math import atan2, degrees, sqrt
 from typing import Tuple
 
 import numpy as np
@@ -57,7 +57,7 @@ def convert_2D_to_3D(array: NDArray) -> NDArray:
 
 def angle_between_vectors(v1, v2) -> float:
     """Returns angles between [-180, 180]"""
-    angle = np.math.atan2(np.linalg.det([v1, v2]), np.dot(v1, v2))  # type: ignore
+    angle = atan2(np.linalg.det([v1, v2]), np.dot(v1, v2))
     return degrees(angle)
 
 
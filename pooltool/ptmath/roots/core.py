@@ -42,6 +42,47 @@ def min_real_root(
             datatype is returned, and it may have residual complex components. Use
             root.real for only the real component.
     """
+    keep = _real_positive(roots, abs_or_rel_cutoff, rtol, atol)
+
+    candidates = roots[keep]
+
+    if candidates.size == 0:
+        return np.complex128(np.inf)
+
+    # Return candidate with the smallest real component
+    return candidates[candidates.real.argmin()]
+
+
+def min_real_roots(
+    roots: NDArray[np.complex128],
+    abs_or_rel_cutoff: float = 1e-3,
+    rtol: float = 1e-3,
+    atol: float = 1e-9,
+) -> NDArray[np.float64]:
+    """Given a 2D array of roots, find the minimum, real, positive root of each row
+
+    The criteria for a root being real and positive are the same as in
+    `min_real_root`, which describes the parameters.
+
+    Returns:
+        roots:
+            A 1D array with the real component of each row's smallest, real, positive
+            root. If a row has no such root, its value is np.inf.
+    """
+    keep = _real_positive(roots, abs_or_rel_cutoff, rtol, atol)
+    return np.where(keep, roots.real, np.inf).min(axis=1)
+
+
+def _real_positive(
+    roots: NDArray[np.complex128],
+    abs_or_rel_cutoff: float,
+    rtol: float,
+    atol: float,
+) -> NDArray[np.bool_]:
+    """Returns a boolean mask of roots considered real and positive
+
+    See `min_real_root` for a description of the parameters.
+    """
     positive = roots.real >= 0.0
 
     imag_mag = np.abs(roots.imag)
@@ -55,13 +96,7 @@ def min_real_root(
     small_keep2 = (real_mag == 0) & (imag_mag == 0)
     small_keep = (small_keep1 | small_keep2) & positive
 
-    candidates = roots[(small & small_keep) | (big & big_keep)]
-
-    if candidates.size == 0:
-        return np.complex128(np.inf)
-
-    # Return candidate with the smallest real component
-    return candidates[candidates.real.argmin()]
+    return (small & small_keep) | (big & big_keep)
 
 
 @jit(nopython=True, cache=const.use_numba_cache)
@@ -5,7 +5,11 @@ from numba import jit
 from numpy.typing import NDArray
 
 import pooltool.constants as const
-from pooltool.ptmath.roots.core import find_first_row_with_value, min_real_root
+from pooltool.ptmath.roots.core import (
+    find_first_row_with_value,
+    min_real_root,
+    min_real_roots,
+)
 from pooltool.utils.strenum import StrEnum, auto
 
 
@@ -49,6 +53,32 @@ def minimum_quartic_root(
     return float(best_root.real), index
 
 
+def minimum_quartic_roots(
+    ps: NDArray[np.float64], solver: QuarticSolver = QuarticSolver.HYBRID
+) -> NDArray[np.float64]:
+    """Solves an array of quartic coefficients, returns smallest, real, positive roots
+
+    Unlike `minimum_quartic_root`, which finds the smallest root among all polynomials,
+    this finds the smallest root of each polynomial.
+
+    Args:
+        ps:
+            A mx5 array of polynomial coefficients. See `minimum_quartic_root`.
+        solver:
+            The method used to calculate the roots. See
+            pooltool.ptmath.roots.quartic.QuarticSolver.
+
+    Returns:
+        real_roots:
+            A length-m array. real_roots[i] is the minimum real root of the polynomial
+            ps[i, :], or np.inf if it has none.
+    """
+    assert QuarticSolver(solver)
+    roots = _quartic_routine[solver](ps)
+
+    return min_real_roots(roots)
+
+
 def solve_many_numerical(p):
     """Solve multiple polynomial equations using companion matrix eigenvalues
 
@@ -34,3 +34,41 @@ def test_e_equals_0():
 
     expected = np.zeros(4, dtype=np.complex128)
     assert (expected == quartic.solve(*coeffs)).all()
+
+
+@pytest.mark.parametrize(
+    "solver", [quartic.QuarticSolver.NUMERIC, quartic.QuarticSolver.HYBRID]
+)
+def test_minimum_quartic_roots(solver: quartic.QuarticSolver):
+    ps = np.array(
+        [
+            # The coefficients of test_case1
+            [
+                0.9604000000000001,
+                -22.342459712735774,
+                131.1430067191817,
+                -13.968966072700297,
+                0.37215503307938314,
+            ],
+            # Roots are 1, 2, 3, and 4
+            [1.0, -10.0, 35.0, -50.0, 24.0],
+            # Roots are -2, -1, 1, and 2
+            [1.0, 0.0, -5.0, 0.0, 4.0],
+            # No real roots
+            [1.0, 0.0, 0.0, 0.0, 1.0],
+            # Roots are -4, -3, -2, and -1
+            [1.0, 10.0, 35.0, 50.0, 24.0],
+        ],
+        dtype=np.float64,
+    )
+
+    roots = quartic.minimum_quartic_roots(ps, solver)
+    assert roots.shape == (len(ps),)
+
+    for k in range(len(ps)):
+        assert roots[k] == quartic.minimum_quartic_root(ps[k : k + 1], solver)[0]
+
+    assert roots[1] == pytest.approx(1.0)
+    assert roots[2] == pytest.approx(1.0)
+    assert roots[3] == np.inf
+    assert roots[4] == np.inf
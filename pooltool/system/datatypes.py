@@ -55,7 +55,10 @@ class System:
         self.t = event.time
 
         for ball in self.balls.values():
-            ball.state.t = event.time
+            # Balls have usually been evolved to the event time already. Skip the
+            # redundant assignment, since setting attributes invokes their converters
+            if ball.state.t != event.time:
+                ball.state.t = event.time
             ball.history.add(ball.state)
 
         self.events.append(event)